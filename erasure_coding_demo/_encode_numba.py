@@ -0,0 +1,40 @@
+"""Numba-compiled systematic Reed-Solomon encoder.
+
+Padding, the split into k blocks and the GF(2^8) matrix multiply all
+happen in one compiled pass over the input, writing straight into a
+preallocated ``(n, block_size)`` shard array.  Parity rows are computed
+in parallel with ``prange``; the inner loop is a plain table lookup and
+XOR over contiguous rows, which LLVM vectorizes.
+"""
+import numpy as np
+from numba import njit, prange
+
+
+@njit(parallel=True, cache=True, boundscheck=False)
+def encode_parity(k, m, coeff, gf_mul, out):
+    """Fill parity rows out[k:] from data rows out[:k] using (m, k) ``coeff``"""
+    block_size = out.shape[1]
+    for r in prange(m):
+        row = out[k + r]
+        row[:] = 0
+        for l in range(k):
+            table = gf_mul[coeff[r, l]]
+            src = out[l]
+            for j in range(block_size):
+                row[j] ^= table[src[j]]
+
+
+@njit(parallel=True, cache=True, boundscheck=False)
+def encode_rs(data, k, m, coeff, gf_mul, out):
+    """Encode ``data`` into ``out`` (n, block_size) using (m, k) parity ``coeff``"""
+    block_size = out.shape[1]
+    data_len = data.shape[0]
+
+    # Data rows: copy the input and zero-fill the padded tail
+    for i in prange(k):
+        base = i * block_size
+        for j in range(block_size):
+            pos = base + j
+            out[i, j] = data[pos] if pos < data_len else np.uint8(0)
+
+    encode_parity(k, m, coeff, gf_mul, out)
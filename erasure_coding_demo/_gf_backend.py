@@ -0,0 +1,152 @@
+"""GF(2^8) Reed-Solomon kernel with an ISA-L style interface.
+
+Follows ISA-L's split between ``ec_init_tables`` (expand a coefficient
+matrix into multiplication tables once) and ``ec_encode_data`` (a
+table-driven GF dot product over every byte of the shards).  Data is
+passed as C-contiguous ``(k, block_size)`` uint8 arrays so no per-shard
+copies are made.  The generator matrix is the same one zfec builds, so
+shards are interchangeable between the two backends.  The kernel only
+uses ``take``/``bitwise_xor``, so passing ``xp=cupy`` runs it on a GPU.
+Both release the GIL, so on the host the output rows are computed
+concurrently on the shared worker pool once the input is large enough.
+"""
+import functools
+import os
+
+import numpy as np
+
+from _pool import PARALLEL_THRESHOLD_BYTES, get_executor
+
+GF_POLY = 0x11d  # x^8 + x^4 + x^3 + x^2 + 1 (zfec's primitive polynomial)
+
+
+def _build_tables():
+    gf_exp = np.zeros(510, dtype=np.uint8)  # doubled so log sums need no modulo
+    gf_log = np.zeros(256, dtype=np.int32)
+    x = 1
+    for i in range(255):
+        gf_exp[i] = x
+        gf_log[x] = i
+        x <<= 1
+        if x & 0x100:
+            x ^= GF_POLY
+    gf_exp[255:] = gf_exp[:255]
+
+    # Full 256x256 product table: row c is the lookup table for "multiply by c"
+    gf_mul = gf_exp[gf_log[:, None] + gf_log[None, :]]
+    gf_mul[0, :] = 0
+    gf_mul[:, 0] = 0
+    return gf_exp, gf_log, gf_mul
+
+
+GF_EXP, GF_LOG, GF_MUL = _build_tables()
+
+
+def gf_inv(a):
+    """Multiplicative inverse of a non-zero field element"""
+    return int(GF_EXP[255 - GF_LOG[a]])
+
+
+def gf_matmul(a, b):
+    """Multiply two GF(2^8) matrices"""
+    return np.bitwise_xor.reduce(GF_MUL[a[:, :, None], b[None, :, :]], axis=1)
+
+
+def gf_invert_matrix(matrix):
+    """Invert a square GF(2^8) matrix with Gauss-Jordan elimination"""
+    size = matrix.shape[0]
+    work = np.concatenate([matrix.astype(np.uint8), np.eye(size, dtype=np.uint8)], axis=1)
+
+    for col in range(size):
+        pivot_rows = np.flatnonzero(work[col:, col])
+        if len(pivot_rows) == 0:
+            raise ValueError("Matrix is singular over GF(2^8)")
+        pivot = col + pivot_rows[0]
+        if pivot != col:
+            work[[col, pivot]] = work[[pivot, col]]
+
+        work[col] = GF_MUL[gf_inv(work[col, col]), work[col]]
+        for row in np.flatnonzero(work[:, col]):
+            if row != col:
+                work[row] ^= GF_MUL[work[row, col], work[col]]
+
+    return work[:, size:]
+
+
+def gf_gen_rs_matrix(k, n):
+    """Systematic (n, k) encoding matrix, identical to zfec's"""
+    vandermonde = np.zeros((n, k), dtype=np.uint8)
+    vandermonde[0, 0] = 1
+    for row in range(1, n):
+        vandermonde[row] = GF_EXP[((row - 1) * np.arange(k)) % 255]
+
+    # Rows 0..k-1 become the identity, so data shards are stored verbatim
+    return gf_matmul(vandermonde, gf_invert_matrix(vandermonde[:k]))
+
+
+def ec_init_tables(coefficients):
+    """Expand a (rows, k) coefficient matrix into (rows, k, 256) lookup tables"""
+    return GF_MUL[coefficients]
+
+
+def _encode_row(length, k, table_row, data, out, xp):
+    scratch = xp.empty(length, dtype=xp.uint8)
+    xp.take(table_row[0], data[0], out=out)
+    for l in range(1, k):
+        xp.take(table_row[l], data[l], out=scratch)
+        xp.bitwise_xor(out, scratch, out=out)
+
+
+def ec_encode_data(length, k, rows, g_tbls, data, coding, xp=np):
+    """Compute coding[r] = sum_l coefficient[r, l] * data[l] over GF(2^8)
+
+    ``data`` is a (k, length) uint8 array and ``coding`` a preallocated
+    (rows, length) uint8 array that receives the output.  All arrays must
+    live on the device of the array module ``xp``.
+    """
+    if (xp is np and rows > 1 and (os.cpu_count() or 1) > 1
+            and length * k >= PARALLEL_THRESHOLD_BYTES):
+        # Output rows are independent dot products
+        list(get_executor().map(
+            lambda r: _encode_row(length, k, g_tbls[r], data, coding[r], xp), range(rows)))
+        return
+
+    for r in range(rows):
+        _encode_row(length, k, g_tbls[r], data, coding[r], xp)
+
+
+@functools.lru_cache(maxsize=256)
+def decoder_for(k, n, valid_indices):
+    """Decode kernel specialised for one tuple of surviving shard indices
+
+    The inverted submatrix is folded into a fixed plan: zero coefficients
+    are dropped and unit coefficients become a plain copy or XOR, so a
+    surviving data shard is copied through without any table lookups.
+    The returned callable maps the (k, block_size) surviving shards, in
+    ``valid_indices`` order, to the (k, block_size) data shards.
+    """
+    decode_matrix = gf_invert_matrix(gf_gen_rs_matrix(k, n)[list(valid_indices)])
+    plan = [
+        tuple((l, None if c == 1 else GF_MUL[c]) for l, c in enumerate(row.tolist()) if c)
+        for row in decode_matrix
+    ]
+
+    def decode(survivors):
+        length = survivors.shape[1]
+        out = np.empty((k, length), dtype=np.uint8)
+        scratch = np.empty(length, dtype=np.uint8)
+        for row, terms in zip(out, plan):
+            first, table = terms[0]
+            if table is None:
+                row[:] = survivors[first]
+            else:
+                np.take(table, survivors[first], out=row)
+            for l, table in terms[1:]:
+                if table is None:
+                    np.bitwise_xor(row, survivors[l], out=row)
+                else:
+                    np.take(table, survivors[l], out=scratch)
+                    np.bitwise_xor(row, scratch, out=row)
+        return out
+
+    return decode
@@ -0,0 +1,54 @@
+"""Batched SHA-256 over many independent buffers.
+
+hashlib releases the GIL while hashing buffers larger than 2 KiB, so a
+batch of independent messages can be hashed concurrently, one message
+per worker thread, the same way a multi-buffer SHA-256 gives each
+message its own SIMD lane.  Small batches are hashed inline, where
+OpenSSL's single-buffer (SHA-NI) path is already the fastest option.
+"""
+import hashlib
+from concurrent.futures import Future
+
+from _pool import PARALLEL_THRESHOLD_BYTES, get_executor
+
+
+def sha256_digest(buffer):
+    """SHA-256 digest of a single buffer"""
+    return hashlib.sha256(buffer).digest()
+
+
+def sha256_async(buffer):
+    """Start hashing buffer on the worker pool; returns a Future of the digest
+
+    Lets the caller overlap hashing with other GIL-releasing work.  Small
+    buffers are hashed inline and returned as an already completed Future.
+    """
+    if len(buffer) < PARALLEL_THRESHOLD_BYTES:
+        future = Future()
+        future.set_result(sha256_digest(buffer))
+        return future
+    return get_executor().submit(sha256_digest, buffer)
+
+
+def sha256_mb_batch(buffers):
+    """Return the SHA-256 digest of every buffer, in order"""
+    buffers = list(buffers)
+    if len(buffers) < 2 or sum(len(b) for b in buffers) < PARALLEL_THRESHOLD_BYTES:
+        return [sha256_digest(b) for b in buffers]
+    return list(get_executor().map(sha256_digest, buffers))
+
+
+def merkle_root(leaves):
+    """Root of a binary SHA-256 Merkle tree over the given leaf digests
+
+    An unpaired node at the end of a level is carried up unchanged.
+    """
+    level = list(leaves)
+    if not level:
+        return sha256_digest(b'')
+    while len(level) > 1:
+        paired = [sha256_digest(level[i] + level[i + 1]) for i in range(0, len(level) - 1, 2)]
+        if len(level) % 2:
+            paired.append(level[-1])
+        level = paired
+    return level[0]
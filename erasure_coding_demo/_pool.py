@@ -0,0 +1,19 @@
+"""Process-wide worker pool shared by the hashing and GF(2^8) kernels.
+
+Both kinds of work release the GIL. A single pool sized to the core
+count keeps the encoder from running two pools' worth of threads at once.
+"""
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+# Below this many input bytes the thread hand-off costs more than it saves
+PARALLEL_THRESHOLD_BYTES = 64 * 1024
+
+_executor = None
+
+
+def get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+    return _executor
@@ -1,85 +1,370 @@
-#!pip install zfec
+#!pip install zfec numpy reed-solomon-leopard  (cupy for device="cuda")
+import contextlib
+import functools
 import hashlib
 import os
 import random
 import math
+import numbers
+import operator
+import time
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import zfec
 
+from _gf_backend import (GF_MUL, decoder_for, ec_encode_data, ec_init_tables, gf_gen_rs_matrix,
+                         gf_invert_matrix)
+from _hashing import merkle_root, sha256_async, sha256_mb_batch
+
+try:
+    from _encode_numba import encode_parity, encode_rs
+except ImportError:
+    encode_parity = encode_rs = None
+
+try:
+    # Python binding of the reed-solomon-simd crate (Leopard-RS, O(n log n))
+    import reed_solomon_leopard
+except ImportError:
+    reed_solomon_leopard = None
+
+try:
+    import cupy as cp
+except ImportError:
+    cp = None
+
+try:
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+except ImportError:
+    Cipher = None
+
+# Shard columns per host <-> GPU round trip; bounds device memory per call
+CUDA_STRIPE_BYTES = 4 * 1024 * 1024
+
+# (k, n) pairs a long-running service is expected to serve; see precompile()
+SERVER_CONFIGS = ((4, 7), (6, 10))
+
+_bench_keystream = None
+
+def _bench_random(n):
+    """Fast pseudo-random benchmark data (not for cryptographic use)
+
+    Uses an AES-CTR keystream (AES-NI) seeded once from os.urandom, or
+    NumPy's PCG64 generator when cryptography is not installed.
+    """
+    global _bench_keystream
+    if _bench_keystream is None:
+        if Cipher is not None:
+            # Encrypting zeros yields the raw keystream
+            encryptor = Cipher(algorithms.AES(os.urandom(16)), modes.CTR(os.urandom(16))).encryptor()
+            _bench_keystream = lambda size: encryptor.update(bytes(size))
+        else:
+            _bench_keystream = np.random.default_rng().bytes
+    return _bench_keystream(n)
+
+@functools.lru_cache(maxsize=64)
+def _get_codec(k, n):
+    """Shared zfec codecs, GF(2^8) encode matrix and its parity tables for (k, n)"""
+    encode_matrix = gf_gen_rs_matrix(k, n)
+    g_tbls = ec_init_tables(encode_matrix[k:])
+    # Shared between instances, so guard against in-place modification
+    encode_matrix.setflags(write=False)
+    g_tbls.setflags(write=False)
+    return zfec.Encoder(k, n), zfec.Decoder(k, n), encode_matrix, g_tbls
+
+def _mask_indices(valid_mask, n):
+    """Indices of the valid shards in a bool array or an int bitfield (bit i = shard i)"""
+    if isinstance(valid_mask, int):
+        packed = np.frombuffer((valid_mask & ((1 << n) - 1)).to_bytes((n + 7) // 8, 'little'), dtype=np.uint8)
+        return np.flatnonzero(np.unpackbits(packed, count=n, bitorder='little'))
+    return np.flatnonzero(valid_mask)
+
+def _read_stripe(reader, buffer):
+    """Fill a contiguous array from reader, zero-padding a short read; returns bytes read"""
+    view = memoryview(buffer).cast('B')
+    filled = 0
+    while filled < len(view):
+        count = reader.readinto(view[filled:])
+        if not count:
+            break
+        filled += count
+    buffer.reshape(-1)[filled:] = 0
+    return filled
+
 class ErasureCodingRecovery:
-    def __init__(self, k=4, n=7, chunk_size=1024*1024):
+    def __init__(self, k=4, n=7, chunk_size=1024*1024, backend="reed_solomon_simd", device="cpu"):
         self.k = k  # data shards needed
         self.n = n  # total shards
         self.m = n - k  # parity shards
-        self.chunk_size = chunk_size
-        self.encoder = zfec.Encoder(k, n)
-        self.decoder = zfec.Decoder(k, n)
+        self.chunk_size = chunk_size  # per-shard stripe width used by encode_stream
+        if backend not in ("reed_solomon_simd", "gf", "zfec"):
+            raise ValueError(f"Unknown backend: {backend}")
+        if device not in ("cpu", "cuda"):
+            raise ValueError(f"Unknown device: {device}")
+        if device == "cuda":
+            if cp is None:
+                raise ValueError("device='cuda' requires CuPy")
+            # The GPU runs the table-driven GF(2^8) kernel
+            backend = "gf"
+        if backend == "reed_solomon_simd" and (
+                reed_solomon_leopard is None or self.m == 0
+                or not reed_solomon_leopard.supports(k, self.m)):
+            # Fall back to zfec when the crate isn't importable
+            backend = "zfec"
+        self.backend = backend
+        self.device = device
+        # Codecs and coefficient tables are built once per (k, n) and shared
+        self.encoder, self.decoder, self.encode_matrix, self.g_tbls = _get_codec(k, n)
+        if device == "cuda":
+            self.g_tbls = cp.asarray(self.g_tbls)
+        # Device-resident decode tables keyed by the tuple of surviving indices
+        self._decode_cache = {}
     
     def encode(self, data):
         """Encode data into n shards using erasure coding"""
-        original_hash = hashlib.sha256(data).hexdigest()
+        return self._encode(data)
+    
+    def encode_many(self, buffers):
+        """Encode several buffers, hashing them together as one batch"""
+        digests = sha256_mb_batch(buffers)
+        return [self._encode(data, digest.hex()) for data, digest in zip(buffers, digests)]
+    
+    def _encode(self, data, original_hash=None):
+        # Hash the input in the background while it is being encoded
+        hash_future = sha256_async(data) if original_hash is None else None
         
-        # Calculate padding
+        # Calculate padding (reed-solomon-simd needs a non-empty, even shard size)
         data_len = len(data)
-        padding_needed = (self.k - (data_len % self.k)) % self.k
-        padded_data = data + b'\x00' * padding_needed
+        align = 2 * self.k if self.backend == "reed_solomon_simd" else self.k
+        padding_needed = (align - (data_len % align)) % align
+        if self.backend == "reed_solomon_simd" and data_len == 0:
+            padding_needed = align
+        block_size = (data_len + padding_needed) // self.k
         
-        # Split into k equal-sized blocks
-        block_size = len(padded_data) // self.k
-        blocks = []
-        for i in range(self.k):
-            start = i * block_size
-            end = start + block_size
-            blocks.append(padded_data[start:end])
-        
-        # Use zfec encoding
-        shards = self.encoder.encode(blocks)
+        # One contiguous (n, block_size) array holds every shard
+        shards = np.empty((self.n, block_size), dtype=np.uint8)
+        if self.backend == "gf" and self.device == "cpu" and encode_rs is not None:
+            # Padding, split and parity in one compiled pass
+            encode_rs(np.frombuffer(data, dtype=np.uint8), self.k, self.m,
+                      self.encode_matrix[self.k:], GF_MUL, shards)
+        else:
+            # Copy the input into the data rows and zero only the padded tail
+            data_rows = shards[:self.k].reshape(-1)
+            data_rows[:data_len] = np.frombuffer(data, dtype=np.uint8)
+            data_rows[data_len:] = 0
+            self._encode_parity(shards)
         
+        valid_mask = np.ones(self.n, dtype=bool)
+        shard_hashes = sha256_mb_batch(shards)
+        if hash_future is not None:
+            original_hash = hash_future.result().hex()
         metadata = {
             'original_length': data_len,
             'padding': padding_needed,
             'block_size': block_size,
-            'hash': original_hash
+            'backend': self.backend,
+            'hash': original_hash,
+            'shard_hashes': shard_hashes,
+            'merkle_root': merkle_root(shard_hashes)
         }
         
-        return shards, metadata
+        return shards, valid_mask, metadata
+    
+    def encode_stream(self, reader):
+        """Encode a binary stream stripe by stripe, yielding (stripe_idx, shards)
+
+        Each stripe carries k * chunk_size input bytes and only the final one
+        is zero-padded. The next stripe is read on a worker thread while the
+        current one is encoded. The yielded (n, chunk_size) array is reused:
+        it is only valid until the next iteration.
+        """
+        if self.backend == "reed_solomon_simd" and self.chunk_size % 2:
+            raise ValueError("reed_solomon_simd needs an even chunk_size")
+        
+        stripe_bytes = self.k * self.chunk_size
+        buffers = [np.empty((self.n, self.chunk_size), dtype=np.uint8) for _ in range(2)]
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            pending = pool.submit(_read_stripe, reader, buffers[0][:self.k])
+            stripe_idx = 0
+            while pending is not None:
+                filled = pending.result()
+                if filled == 0:
+                    break
+                shards = buffers[stripe_idx % 2]
+                pending = None
+                if filled == stripe_bytes:
+                    pending = pool.submit(_read_stripe, reader, buffers[(stripe_idx + 1) % 2][:self.k])
+                self._encode_parity(shards)
+                yield stripe_idx, shards
+                stripe_idx += 1
     
-    def decode(self, shards, metadata):
-        """Decode data from any k valid shards"""
+    def _encode_parity(self, shards):
+        """Fill the parity rows shards[k:] from the data rows shards[:k]"""
+        block_size = shards.shape[1]
+        if self.backend == "reed_solomon_simd":
+            # The binding takes bytes: k originals in, n-k recovery shards out
+            recovery = reed_solomon_leopard.encode([row.tobytes() for row in shards[:self.k]], self.m)
+            shards[self.k:] = np.frombuffer(b''.join(recovery), dtype=np.uint8).reshape(self.m, block_size)
+        elif self.backend == "gf":
+            if self.device == "cpu" and encode_parity is not None:
+                encode_parity(self.k, self.m, self.encode_matrix[self.k:], GF_MUL, shards)
+            else:
+                self._apply_tables(self.g_tbls, shards[:self.k], self.m, out=shards[self.k:])
+        else:
+            # Use zfec encoding
+            encoded = self.encoder.encode(list(shards[:self.k]))
+            for i in range(self.k, self.n):
+                shards[i] = np.frombuffer(encoded[i], dtype=np.uint8)
+    
+    def decode(self, shards, valid_mask, metadata, verify_payload=None):
+        """Decode data from any k valid shards
+
+        valid_mask is either a bool array or an integer bitfield (Python or
+        NumPy int) with bit i set when shard i is available. Each shard used is checked against its
+        stored SHA-256 before decoding. Shard hashes only prove the inputs
+        are intact, so by default the hash of the whole payload is checked
+        too whenever parity shards took part in the decode; pass True or
+        False to always or never check it.
+        """
         if len(shards) != self.n:
             raise ValueError(f"Expected {self.n} shards, got {len(shards)}")
         
-        # Find valid shards and their indices
-        valid_shards = []
-        valid_indices = []
+        # NumPy integer scalars are bitfields too, not one-element masks
+        if isinstance(valid_mask, numbers.Integral):
+            valid_mask = operator.index(valid_mask)
+        
+        # Count valid shards without a per-shard Python loop
+        if isinstance(valid_mask, int):
+            valid_count = (valid_mask & ((1 << self.n) - 1)).bit_count()
+        else:
+            valid_count = int(np.count_nonzero(valid_mask))
+        if valid_count < self.k:
+            raise ValueError(f"Need at least {self.k} shards to recover, but only {valid_count} are valid")
         
-        for i, shard in enumerate(shards):
-            if shard is not None:
-                valid_shards.append(shard)
-                valid_indices.append(i)
+        # Parity is only interchangeable between gf and zfec, so decode with
+        # the backend that encoded; metadata without one predates the field
+        backend = metadata.get('backend', self.backend)
+        if backend == "reed_solomon_simd" and reed_solomon_leopard is None:
+            raise ValueError("Shards were encoded with reed_solomon_simd, which is not installed")
         
-        if len(valid_shards) < self.k:
-            raise ValueError(f"Need at least {self.k} shards to recover, but only {len(valid_shards)} are valid")
+        if merkle_root(metadata['shard_hashes']) != metadata['merkle_root']:
+            raise ValueError("Shard hashes do not match the Merkle root")
         
-        if len(valid_shards) > self.k:
-            # We have more than k shards, select first k
-            valid_shards = valid_shards[:self.k]
-            valid_indices = valid_indices[:self.k]
+        # If more than k are available, the first k intact ones are used
+        valid_indices = self._verified_indices(shards, _mask_indices(valid_mask, self.n), metadata)
+        survivors = shards[valid_indices]
+        if verify_payload is None:
+            verify_payload = bool(valid_indices[-1] >= self.k)
         
-        # Use zfec decoding
-        decoded_blocks = self.decoder.decode(valid_shards, valid_indices)
-        recovered_data = b''.join(decoded_blocks)
+        if backend == "reed_solomon_simd":
+            decoded = self._decode_rs_simd(survivors, valid_indices)
+        elif backend == "gf":
+            decoded = self._decode_gf(survivors, valid_indices)
+        else:
+            # Use zfec decoding
+            decoded_blocks = self.decoder.decode(list(survivors), valid_indices.tolist())
+            decoded = np.frombuffer(b''.join(decoded_blocks), dtype=np.uint8).reshape(self.k, -1)
         
-        # Remove padding
-        if metadata['padding'] > 0:
-            recovered_data = recovered_data[:-metadata['padding']]
+        # Remove padding while copying out (one allocation); when verifying,
+        # the unpadded view is hashed concurrently with that copy
+        recovered_view = decoded.reshape(-1)[:metadata['original_length']]
+        hash_future = sha256_async(recovered_view) if verify_payload else None
+        recovered_data = recovered_view.tobytes()
         
         # Verify hash
-        recovered_hash = hashlib.sha256(recovered_data).hexdigest()
-        if recovered_hash != metadata['hash']:
-            raise ValueError(f"SHA-256 mismatch! Original: {metadata['hash']}, Recovered: {recovered_hash}")
+        if verify_payload:
+            recovered_hash = hash_future.result().hex()
+            if recovered_hash != metadata['hash']:
+                raise ValueError(f"SHA-256 mismatch! Original: {metadata['hash']}, Recovered: {recovered_hash}")
         
         return recovered_data
 
+    def _verified_indices(self, shards, candidates, metadata):
+        """First k candidate shards whose SHA-256 matches the stored shard hash"""
+        expected = metadata['shard_hashes']
+        verified = []
+        pos = 0
+        while len(verified) < self.k and pos < len(candidates):
+            # Hash just enough candidates to fill the gap, as one batch
+            batch = candidates[pos:pos + self.k - len(verified)].tolist()
+            pos += len(batch)
+            digests = sha256_mb_batch(shards[i] for i in batch)
+            verified.extend(i for i, digest in zip(batch, digests) if digest == expected[i])
+        
+        if len(verified) < self.k:
+            raise ValueError(f"Need at least {self.k} intact shards to recover, but only {len(verified)} passed verification")
+        return np.array(verified)
+
+    def _decode_rs_simd(self, survivors, valid_indices):
+        """Restore the (k, block_size) original blocks with reed-solomon-simd"""
+        if valid_indices[-1] < self.k:
+            return survivors
+        
+        original = {}
+        recovery = {}
+        for idx, shard in zip(valid_indices.tolist(), survivors):
+            if idx < self.k:
+                original[idx] = shard.tobytes()
+            else:
+                recovery[idx - self.k] = shard.tobytes()
+        
+        restored = reed_solomon_leopard.decode(self.k, self.m, original, recovery)
+        decoded = np.empty_like(survivors)
+        for i in range(self.k):
+            decoded[i] = np.frombuffer(original[i] if i in original else restored[i], dtype=np.uint8)
+        return decoded
+
+    def _decode_gf(self, survivors, valid_indices):
+        """Restore the (k, block_size) original blocks by inverting the surviving rows"""
+        if valid_indices[-1] < self.k:
+            return survivors
+        
+        if self.device == "cpu":
+            # Kernel specialised (and cached) for this loss pattern
+            return decoder_for(self.k, self.n, tuple(valid_indices.tolist()))(survivors)
+        
+        key = tuple(valid_indices.tolist())
+        g_tbls = self._decode_cache.get(key)
+        if g_tbls is None:
+            g_tbls = cp.asarray(ec_init_tables(gf_invert_matrix(self.encode_matrix[valid_indices])))
+            self._decode_cache[key] = g_tbls
+        return self._apply_tables(g_tbls, survivors, self.k)
+
+    def _apply_tables(self, g_tbls, src, rows, out=None):
+        """Run the GF(2^8) kernel over a (k, block_size) array on the configured device"""
+        block_size = src.shape[1]
+        if out is None:
+            out = np.empty((rows, block_size), dtype=np.uint8)
+        if self.device != "cuda":
+            ec_encode_data(block_size, self.k, rows, g_tbls, src, out)
+            return out
+        
+        # Column stripes keep device buffers bounded for large shards; each
+        # stripe is uploaded, encoded and downloaded in turn
+        for start in range(0, block_size, CUDA_STRIPE_BYTES):
+            end = min(start + CUDA_STRIPE_BYTES, block_size)
+            src_dev = cp.asarray(np.ascontiguousarray(src[:, start:end]))
+            out_dev = cp.empty((rows, end - start), dtype=cp.uint8)
+            ec_encode_data(end - start, self.k, rows, g_tbls, src_dev, out_dev, xp=cp)
+            out[:, start:end] = out_dev.get()
+        return out
+
+def precompile(configs=SERVER_CONFIGS):
+    """Prepare fixed (k, n) configurations before the first request arrives
+
+    Builds the shared codecs and tables for each pair and runs one small
+    encode per backend, so Numba's compiled kernels are ready as well.
+    """
+    for k, n in configs:
+        for backend in ("reed_solomon_simd", "gf"):
+            ErasureCodingRecovery(k, n, backend=backend).encode(bytes(2 * k))
+
+@contextlib.contextmanager
+def timer(phase, results):
+    """Time the block with perf_counter_ns and append {'phase', 'ns'} to results"""
+    start = time.perf_counter_ns()
+    yield
+    results.append({'phase': phase, 'ns': time.perf_counter_ns() - start})
+
 def demonstrate_3_of_7():
     """Demonstrate 3-of-7 recovery"""
     print("3-of-7 RECOVERY DEMONSTRATION")
@@ -89,13 +374,13 @@ def demonstrate_3_of_7():
     ec_system = ErasureCodingRecovery(k=3, n=7, chunk_size=1024)
     
     # Create test data
-    test_data = b"Critical data that must be protected across distributed storage: " + os.urandom(500)
+    test_data = b"Critical data that must be protected across distributed storage: " + _bench_random(500)
     print(f"Original data: {len(test_data)} bytes")
     print(f"SHA-256: {hashlib.sha256(test_data).hexdigest()}")
     print()
     
     # Encode
-    all_shards, metadata = ec_system.encode(test_data)
+    all_shards, valid_mask, metadata = ec_system.encode(test_data)
     print(f"Encoded into {len(all_shards)} shards (3 data + 4 parity)")
     print(f"Can recover from any 3 of 7 shards")
     print(f"Can lose up to 4 shards and still recover!")
@@ -111,18 +396,18 @@ def demonstrate_3_of_7():
         ("Lose 5 shards - SHOULD FAIL", [0, 1, 3, 5, 6]),
     ]
     
+    # The shard array is never modified; each scenario only resets one mask
     for scenario_name, lost_indices in scenarios:
         print(f"Testing: {scenario_name}")
         if lost_indices:
             print(f"  Lost shards: {lost_indices}")
         
-        # Create test shards with some missing
-        test_shards = all_shards.copy()
-        for idx in lost_indices:
-            test_shards[idx] = None
+        # Mark some shards as missing
+        valid_mask[:] = True
+        valid_mask[lost_indices] = False
         
         try:
-            recovered_data = ec_system.decode(test_shards, metadata)
+            recovered_data = ec_system.decode(all_shards, valid_mask, metadata)
             success = recovered_data == test_data
             print(f"  ✓ Recovery successful! Data matches: {success}")
             print(f"  Recovered {len(recovered_data)} bytes")
@@ -147,7 +432,7 @@ def demonstrate_any_k_shards():
     print()
     
     # Encode
-    shards, metadata = ec_system.encode(test_data)
+    shards, valid_mask, metadata = ec_system.encode(test_data)
     
     # Test different combinations of shards
     test_combinations = [
@@ -158,12 +443,11 @@ def demonstrate_any_k_shards():
     ]
     
     for i, combination in enumerate(test_combinations):
-        test_shards = [None] * n
-        for idx in combination:
-            test_shards[idx] = shards[idx]
+        valid_mask[:] = False
+        valid_mask[combination] = True
         
         try:
-            recovered = ec_system.decode(test_shards, metadata)
+            recovered = ec_system.decode(shards, valid_mask, metadata)
             print(f"Combination {i+1}: Shards {combination}")
             print(f"  ✓ Success: {recovered == test_data}")
             if recovered == test_data:
@@ -183,38 +467,40 @@ def performance_test():
     ec_system = ErasureCodingRecovery(k=k, n=n, chunk_size=1024*1024)
     
     # Generate 1MB of data
-    test_data = os.urandom(1024*1024)
+    test_data = _bench_random(1024*1024)
     print(f"Testing with 1MB data ({len(test_data):,} bytes)")
     print(f"Configuration: {k}-of-{n}")
     print(f"Storage overhead: {((n/k - 1) * 100):.1f}%")
     print(f"Can lose up to {n-k} shards")
     print()
     
-    # Encode
-    import time
-    start_time = time.time()
-    shards, metadata = ec_system.encode(test_data)
-    encode_time = time.time() - start_time
-    print(f"Encoding time: {encode_time:.3f} seconds")
+    # Timings are collected first and printed afterwards, so stdout I/O
+    # never lands inside a measured region
+    timings = []
+    with timer('encode', timings):
+        shards, valid_mask, metadata = ec_system.encode(test_data)
     
     # Test recovery with maximum loss
-    lost_indices = random.sample(range(n), n-k)
-    test_shards = shards.copy()
-    for idx in lost_indices:
-        test_shards[idx] = None
+    rng = np.random.default_rng()
+    lost_indices = rng.choice(n, size=n-k, replace=False)
+    valid_mask[lost_indices] = False
     
-    print(f"Simulating loss of {n-k} shards: {lost_indices}")
-    
-    start_time = time.time()
+    error = None
     try:
-        recovered_data = ec_system.decode(test_shards, metadata)
-        decode_time = time.time() - start_time
-        success = recovered_data == test_data
-        print(f"Decoding time: {decode_time:.3f} seconds")
-        print(f"✓ Recovery successful: {success}")
-        print(f"Recovered data size: {len(recovered_data):,} bytes")
+        with timer('decode', timings):
+            recovered_data = ec_system.decode(shards, valid_mask, metadata)
     except Exception as e:
-        print(f"✗ Recovery failed: {e}")
+        error = e
+    
+    elapsed = {r['phase']: r['ns'] / 1e9 for r in timings}
+    print(f"Encoding time: {elapsed['encode']:.6f} seconds")
+    print(f"Simulating loss of {n-k} shards: {lost_indices.tolist()}")
+    if error is None:
+        print(f"Decoding time: {elapsed['decode']:.6f} seconds")
+        print(f"✓ Recovery successful: {recovered_data == test_data}")
+        print(f"Recovered data size: {len(recovered_data):,} bytes")
+    else:
+        print(f"✗ Recovery failed: {error}")
 
 def real_world_scenarios():
     """Show real-world use cases"""
@@ -269,7 +555,7 @@ if __name__ == "__main__":
     print("=" * 60)
     print("""
 ✅ Features Working:
-• True k-of-N erasure coding with zfec
+• True k-of-N erasure coding (reed-solomon-simd, GF(2^8) tables or zfec)
 • SHA-256 integrity verification  
 • Configurable redundancy levels
 • Efficient encoding/decoding
@@ -296,7 +582,7 @@ Erasure Coding k-of-N Recovery System
 3-of-7 RECOVERY DEMONSTRATION
 ========================================
 Original data: 565 bytes
-SHA-256: 9812755bcfb25e74f470d7d2de25aa9a8e9fde86f6e21ec02a9777e41cdde628
+SHA-256: e9dbd5b176146a5017cb2670b974f4d7dc3ba820ccbc01e863b2749d5458ae8d
 
 Encoded into 7 shards (3 data + 4 parity)
 Can recover from any 3 of 7 shards
@@ -362,9 +648,9 @@ Configuration: 5-of-10
 Storage overhead: 100.0%
 Can lose up to 5 shards
 
-Encoding time: 0.054 seconds
-Simulating loss of 5 shards: [5, 8, 2, 3, 9]
-Decoding time: 0.038 seconds
+Encoding time: 0.006231 seconds
+Simulating loss of 5 shards: [0, 1, 9, 4, 7]
+Decoding time: 0.006062 seconds
 ✓ Recovery successful: True
 Recovered data size: 1,048,576 bytes
 
@@ -377,28 +663,28 @@ Cloud Storage Backup:
   Configuration: 4-of-7
   Can withstand 3 failures
   Storage locations: AWS S3, Google Cloud, Azure, Backblaze, On-premise, Cold Storage, DR Site
-  ✓ Can continue operating even if these fail: On-premise, DR Site, Azure
+  ✓ Can continue operating even if these fail: Google Cloud, Backblaze, AWS S3
 
 Distributed Database:
   Distribute database shards across regions for high availability
   Configuration: 3-of-5
   Can withstand 2 failures
   Storage locations: US-East, US-West, Europe, Asia, South America
-  ✓ Can continue operating even if these fail: Europe, US-East
+  ✓ Can continue operating even if these fail: US-East, South America
 
 Media Streaming:
   Distribute video chunks across CDN edge locations
   Configuration: 6-of-10
   Can withstand 4 failures
   Storage locations: Edge-1, Edge-2, Edge-3, Edge-4, Edge-5, Edge-6, Edge-7, Edge-8, Edge-9, Edge-10
-  ✓ Can continue operating even if these fail: Edge-8, Edge-7, Edge-4, Edge-1
+  ✓ Can continue operating even if these fail: Edge-6, Edge-10, Edge-7, Edge-1
 
 ============================================================
 SYSTEM READY FOR PRODUCTION USE
 ============================================================
 
 ✅ Features Working:
-• True k-of-N erasure coding with zfec
+• True k-of-N erasure coding (reed-solomon-simd, GF(2^8) tables or zfec)
 • SHA-256 integrity verification  
 • Configurable redundancy levels
 • Efficient encoding/decoding
@@ -416,5 +702,4 @@ SYSTEM READY FOR PRODUCTION USE
 • Fast encoding/decoding
 • Minimal memory overhead
 • Scalable to hundreds of shards
-
-"""
\ No newline at end of file
+"""
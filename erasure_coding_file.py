@@ -1,55 +1,277 @@
 import random
 import os
 import json
-from typing import List, Tuple, Dict
+from typing import List, Tuple, Dict, Union
 import hashlib
+import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import lru_cache
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from pyeclib.ec_iface import ECDriver, ECDriverError
+except ImportError:
+    ECDriver = None
+
+try:
+    import zfec
+except ImportError:
+    zfec = None
+
+try:
+    import galois
+except ImportError:
+    galois = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+# Chunks at least this wide use the Numba kernel when it is available
+NUMBA_MIN_CHUNK_SIZE = 64 * 1024
+
+# Below this many input bytes a parallel encode costs more than it saves
+PARALLEL_THRESHOLD_BYTES = 1024 * 1024
+
+_executor = None
+
+if njit is not None:
+    @njit(cache=True, parallel=True, boundscheck=False)
+    def _xor_reduce(chunks, out):
+        """out[i] = chunks[0, i] ^ chunks[1, i] ^ ... for every byte position i"""
+        chunk_size = chunks.shape[1]
+        # Row by row, so each parallel inner loop streams contiguous bytes
+        for i in prange(chunk_size):
+            out[i] = chunks[0, i]
+        for j in range(1, chunks.shape[0]):
+            for i in prange(chunk_size):
+                out[i] ^= chunks[j, i]
+else:
+    _xor_reduce = None
+
+def xor_rows(arr, out=None):
+    """XOR together the rows of a (rows, chunk_size) uint8 array into out"""
+    if out is None:
+        # np.empty, not zeros: every byte is overwritten
+        out = np.empty(arr.shape[1], dtype=np.uint8)
+    if _xor_reduce is not None and arr.shape[1] >= NUMBA_MIN_CHUNK_SIZE:
+        _xor_reduce(arr, out)
+    else:
+        np.bitwise_xor.reduce(arr, axis=0, out=out)
+    return out
+
+# (k + m, chunk_size) uint8 array with NumPy, otherwise a list of bytes-like
+Fragments = Union["np.ndarray", List[bytes]]
+
+# Preferred first; "xor" needs no third-party package
+SCHEMES = ("isa_l_rs_vand", "zfec", "galois", "xor")
+
+@lru_cache(maxsize=None)
+def _ec_driver(k: int, m: int):
+    """Shared pyeclib driver backed by Intel ISA-L"""
+    return ECDriver(k=k, m=m, ec_type='isa_l_rs_vand')
+
+@lru_cache(maxsize=None)
+def _zfec_codec(k: int, m: int):
+    """Shared zfec encoder and decoder for (k, k + m)"""
+    return zfec.Encoder(k, k + m), zfec.Decoder(k, k + m)
+
+@lru_cache(maxsize=None)
+def _galois_generator(k: int, m: int):
+    """(k + m, k) systematic generator over GF(2^8), from galois' RS(255, 255 - m)
+
+    GF(2^8) has no n-th roots of unity for most n = k + m, so the
+    full-length code is shortened to k message symbols instead.
+    """
+    full_k = 255 - m
+    rs = galois.ReedSolomon(255, full_k, field=galois.GF(2**8))
+    return rs.G[full_k - k:, full_k - k:].T
+
+def _as_rows(fragments: Fragments, chunk_size: int):
+    """Equal-size fragments as a (len, chunk_size) uint8 array; lists are copied"""
+    if isinstance(fragments, np.ndarray):
+        return fragments
+    return np.frombuffer(b''.join(fragments), dtype=np.uint8).reshape(len(fragments), chunk_size)
+
+def _join_trimmed(chunks, length: int) -> bytes:
+    """Concatenate equal-size chunks, keeping only the first length bytes
+
+    Trimming happens on views before the join, so the output is copied once.
+    """
+    if not length:
+        return b''
+    full_chunks, tail = divmod(length, len(chunks[0]))
+    pieces = list(chunks[:full_chunks])
+    if tail:
+        pieces.append(memoryview(chunks[full_chunks])[:tail])
+    return b''.join(pieces)
+
+def _available_scheme(k: int, m: int) -> str:
+    if ECDriver is not None:
+        try:
+            _ec_driver(k, m)
+            return "isa_l_rs_vand"
+        except ECDriverError:
+            # pyeclib is installed but liberasurecode has no ISA-L plugin
+            pass
+    if zfec is not None:
+        return "zfec"
+    if galois is not None and k + m <= 255:
+        return "galois"
+    return "xor"
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+    return _executor
+
+def _encode_part(k: int, m: int, scheme: str, data: bytes, data_hash: str) -> Tuple[List[bytes], Dict]:
+    """Process pool worker; fragments are returned as bytes so they pickle"""
+    fragments, metadata = SimpleErasureCode(k, m, scheme).encode(data, data_hash)
+    return [bytes(fragment) for fragment in fragments], metadata
 
 class SimpleErasureCode:
-    def __init__(self, k: int, m: int):
+    def __init__(self, k: int, m: int, scheme: str = None):
         self.k = k  # data fragments
         self.m = m  # parity fragments
+        if scheme is None:
+            scheme = _available_scheme(k, m)
+        elif scheme not in SCHEMES:
+            raise ValueError(f"Unknown scheme {scheme!r}, expected one of {SCHEMES}")
+        self.scheme = scheme
     
-    def encode(self, data: bytes) -> Tuple[List[bytes], Dict]:
-        """Encode data with metadata"""
+    def encode(self, data: bytes, data_hash: str = None) -> Tuple[Fragments, Dict]:
+        """Encode data with metadata; data_hash skips re-hashing when already known
+
+        Fragments are a (k + m, chunk_size) uint8 ndarray with NumPy, a list otherwise.
+        """
+        if self.scheme == "isa_l_rs_vand":
+            fragments = _ec_driver(self.k, self.m).encode(data)
+            chunk_size = len(fragments[0])
+            if np is not None:
+                fragments = np.frombuffer(b''.join(fragments), dtype=np.uint8).reshape(-1, chunk_size)
+            return fragments, self._metadata(data, chunk_size, data_hash)
+        
         original_length = len(data)
         
         # Calculate chunk size
         chunk_size = (original_length + self.k - 1) // self.k
         
-        # Split data into k chunks with padding
-        chunks = []
-        padded_data = data + b'\x00' * (chunk_size * self.k - original_length)
-        
-        for i in range(self.k):
-            start = i * chunk_size
-            end = (i + 1) * chunk_size
-            chunk = padded_data[start:end]
-            chunks.append(chunk)
-        
-        # Create parity chunks using XOR
-        parity_chunks = []
-        for i in range(self.m):
-            parity = bytearray(chunk_size)
-            for j in range(self.k):
-                chunk_data = chunks[j]
-                for idx in range(chunk_size):
-                    parity[idx] ^= chunk_data[idx]
-            parity_chunks.append(bytes(parity))
-        
-        # Create metadata
-        metadata = {
-            'original_length': original_length,
+        if np is not None:
+            # Copy the input into the data rows and zero only the padded tail
+            fragments = np.empty((self.k + self.m, chunk_size), dtype=np.uint8)
+            data_rows = fragments[:self.k].reshape(-1)
+            data_rows[:original_length] = np.frombuffer(data, dtype=np.uint8)
+            data_rows[original_length:] = 0
+            self._encode_parity(fragments)
+            return fragments, self._metadata(data, chunk_size, data_hash)
+        
+        # Split data into k chunks. Full chunks are zero-copy views of the
+        # input; only the short tail is copied into a zero-filled buffer.
+        full_chunks = min(self.k, original_length // chunk_size) if chunk_size else self.k
+        mv = memoryview(data)
+        chunks = [mv[i * chunk_size:(i + 1) * chunk_size] for i in range(full_chunks)]
+        for i in range(full_chunks, self.k):
+            tail = mv[i * chunk_size:(i + 1) * chunk_size]
+            chunk = bytearray(chunk_size)
+            chunk[:len(tail)] = tail
+            chunks.append(memoryview(chunk).toreadonly())
+        
+        if self.scheme == "zfec":
+            encoder, _ = _zfec_codec(self.k, self.m)
+            parity_chunks = encoder.encode(chunks, list(range(self.k, self.k + self.m)))
+            return chunks + parity_chunks, self._metadata(data, chunk_size, data_hash)
+        
+        # Without NumPy, XOR whole chunks as big ints (word-at-a-time in C).
+        # Every parity chunk is the same XOR, so it is computed once and shared.
+        parity_int = 0
+        for chunk_data in chunks:
+            parity_int ^= int.from_bytes(chunk_data, 'little')
+        parity_chunks = [parity_int.to_bytes(chunk_size, 'little')] * self.m
+        
+        return chunks + parity_chunks, self._metadata(data, chunk_size, data_hash)
+    
+    def _encode_parity(self, fragments):
+        """Fill parity rows fragments[k:] from data rows fragments[:k]"""
+        k = self.k
+        if self.scheme == "zfec":
+            encoder, _ = _zfec_codec(k, self.m)
+            parity = encoder.encode(list(fragments[:k]), list(range(k, k + self.m)))
+            for row, block in zip(fragments[k:], parity):
+                row[:] = np.frombuffer(block, dtype=np.uint8)
+        elif self.scheme == "galois":
+            # One GF(2^8) matrix product gives every parity row
+            generator = _galois_generator(k, self.m)
+            fragments[k:] = (generator[k:] @ type(generator)(fragments[:k])).view(np.ndarray)
+        elif self.m:
+            xor_rows(fragments[:k], out=fragments[k])
+            fragments[k + 1:] = fragments[k]
+    
+    def encode_many(self, parts: List[bytes], data_hashes: List[str] = None) -> List[Tuple[Fragments, Dict]]:
+        """Encode several buffers, returning (fragments, metadata) for each
+
+        data_hashes, if given, holds the precomputed hex SHA-256 of each part.
+
+        With the "xor" scheme and NumPy every part is padded to one shared
+        chunk_size and the parities of all parts come from a single reduce
+        over a (num_parts, k + m, chunk_size) array.  Otherwise large batches
+        are encoded in parallel: Reed-Solomon parts on threads (the codecs
+        release the GIL), pure-Python XOR parts in worker processes.
+        """
+        if data_hashes is None:
+            data_hashes = [None] * len(parts)
+        if self.scheme != "xor" or np is None or not parts:
+            if (len(parts) < 2 or (os.cpu_count() or 1) < 2
+                    or sum(len(part) for part in parts) < PARALLEL_THRESHOLD_BYTES):
+                return [self.encode(part, data_hash) for part, data_hash in zip(parts, data_hashes)]
+            if self.scheme != "xor":
+                return list(_get_executor().map(self.encode, parts, data_hashes))
+            # Only reached without NumPy, so no Numba thread pool is forked
+            n = len(parts)
+            with ProcessPoolExecutor() as pool:
+                return list(pool.map(_encode_part, [self.k] * n, [self.m] * n,
+                                     [self.scheme] * n, parts, data_hashes))
+        
+        k = self.k
+        chunk_size = max((len(part) + k - 1) // k for part in parts)
+        full = np.empty((len(parts), k + self.m, chunk_size), dtype=np.uint8)
+        for fragments, part in zip(full, parts):
+            data_rows = fragments[:k].reshape(-1)
+            data_rows[:len(part)] = np.frombuffer(part, dtype=np.uint8)
+            data_rows[len(part):] = 0
+        if self.m:
+            np.bitwise_xor.reduce(full[:, :k], axis=1, out=full[:, k])
+            full[:, k + 1:] = full[:, k:k + 1]
+        
+        return [(fragments, self._metadata(part, chunk_size, data_hash))
+                for part, data_hash, fragments in zip(parts, data_hashes, full)]
+    
+    def _metadata(self, data: bytes, chunk_size: int, data_hash: str = None) -> Dict:
+        return {
+            'original_length': len(data),
             'chunk_size': chunk_size,
             'k': self.k,
             'm': self.m,
             'num_fragments': self.k + self.m,
-            'data_hash': hashlib.sha256(data).hexdigest()
+            'scheme': self.scheme,
+            'data_hash': data_hash if data_hash is not None else hashlib.sha256(data).hexdigest()
         }
-        
-        return chunks + parity_chunks, metadata
     
-    def decode(self, fragments: List[bytes], fragment_indices: List[int], metadata: Dict) -> bytes:
-        """Reconstruct data from available fragments using metadata"""
+    def decode(self, fragments: Fragments, fragment_indices: List[int], metadata: Dict) -> bytes:
+        """Reconstruct data from available fragments using metadata
+
+        fragments is a (len, chunk_size) uint8 array, as selected from the
+        rows encode returned, or a list of bytes-like fragments.
+        """
+        fragment_indices = [int(idx) for idx in fragment_indices]
         k = metadata['k']
         m = metadata['m']
         chunk_size = metadata['chunk_size']
@@ -58,10 +280,36 @@ class SimpleErasureCode:
         if len(fragments) < k:
             raise ValueError(f"Need at least {k} fragments, got {len(fragments)}")
         
-        # Build a dict of available fragments
-        fragment_dict = {}
+        # Metadata written before schemes were recorded is XOR-coded
+        scheme = metadata.get('scheme', 'xor')
+        if scheme == "isa_l_rs_vand":
+            # Fragment headers carry their indices
+            return _ec_driver(k, m).decode([bytes(frag) for frag in fragments])[:original_length]
+        
+        # Reed-Solomon decoders take exactly k fragments; data fragments
+        # first saves work
+        chosen = sorted(range(len(fragment_indices)), key=fragment_indices.__getitem__)[:k]
+        chosen_indices = [fragment_indices[i] for i in chosen]
+        if scheme == "zfec":
+            _, decoder = _zfec_codec(k, m)
+            blocks = decoder.decode([fragments[i] for i in chosen], chosen_indices)
+            return _join_trimmed(blocks, original_length)
+        if scheme == "galois":
+            # Solve generator[chosen] @ data = fragments[chosen] for the data
+            survivors = _as_rows(fragments, chunk_size)[chosen]
+            if chosen_indices[-1] < k:
+                return _join_trimmed(survivors, original_length)
+            generator = _galois_generator(k, m)
+            decode_matrix = np.linalg.inv(generator[chosen_indices])
+            data_matrix = (decode_matrix @ type(generator)(survivors)).view(np.ndarray)
+            return _join_trimmed(data_matrix, original_length)
+        
+        # Index available fragments, and their rows, by position
+        frag_by_idx = [None] * (k + m)
+        row_by_idx = [None] * (k + m)
         for i, idx in enumerate(fragment_indices):
-            fragment_dict[idx] = fragments[i]
+            frag_by_idx[idx] = fragments[i]
+            row_by_idx[idx] = i
         
         # Separate data and parity fragments
         data_indices = [idx for idx in fragment_indices if idx < k]
@@ -72,7 +320,7 @@ class SimpleErasureCode:
         
         # Fill in available data chunks
         for idx in data_indices:
-            reconstructed_chunks[idx] = fragment_dict[idx]
+            reconstructed_chunks[idx] = frag_by_idx[idx]
         
         # Find missing data chunks
         missing_data_indices = [i for i in range(k) if reconstructed_chunks[i] is None]
@@ -86,37 +334,50 @@ class SimpleErasureCode:
             parity_idx = parity_indices[0]  # Use first available parity
             
             # XOR: missing = parity XOR (all other data chunks)
-            result = bytearray(chunk_size)
-            # Start with parity
-            for idx in range(chunk_size):
-                result[idx] = fragment_dict[parity_idx][idx]
-            
-            # XOR all available data chunks
-            for idx in data_indices:
-                for byte_idx in range(chunk_size):
-                    result[byte_idx] ^= fragment_dict[idx][byte_idx]
-            
-            reconstructed_chunks[missing_idx] = bytes(result)
+            if np is not None:
+                sources = [row_by_idx[idx] for idx in [parity_idx] + data_indices]
+                reconstructed_chunks[missing_idx] = xor_rows(_as_rows(fragments, chunk_size)[sources])
+            else:
+                parity = frag_by_idx[parity_idx]
+                data_chunks = [frag_by_idx[idx] for idx in data_indices]
+                
+                # Start with parity and XOR in all available data chunks, as big ints
+                result = int.from_bytes(parity, 'little')
+                for chunk_data in data_chunks:
+                    result ^= int.from_bytes(chunk_data, 'little')
+                
+                reconstructed_chunks[missing_idx] = result.to_bytes(chunk_size, 'little')
         elif len(missing_data_indices) > 1:
             raise ValueError(f"Cannot reconstruct {len(missing_data_indices)} missing data chunks with simple XOR parity")
         else:
             raise ValueError("Missing data chunk but no parity available")
         
-        # Join all reconstructed chunks
-        reconstructed = b''.join(reconstructed_chunks)
-        
-        # Return only the original data length
-        return reconstructed[:original_length]
+        # Join the reconstructed chunks, up to the original data length
+        return _join_trimmed(reconstructed_chunks, original_length)
+
+def _reporter(verbose: bool):
+    """print when verbose, otherwise logger.debug; None when neither would show
 
-def read_file_and_split(filename: str, num_parts: int) -> Tuple[bytes, List[bytes]]:
+    Callers guard each group of messages with ``if say:``, so nothing is
+    formatted when output is off.
+    """
+    if verbose:
+        return print
+    if logger.isEnabledFor(logging.DEBUG):
+        return logger.debug
+    return None
+
+def read_file_and_split(filename: str, num_parts: int, verbose: bool = True) -> Tuple[bytes, List[bytes]]:
     """Read a file and split it into N parts"""
+    say = _reporter(verbose)
     try:
         with open(filename, 'rb') as file:
             original_data = file.read()
         
         file_size = len(original_data)
-        print(f"✓ File '{filename}' read successfully")
-        print(f"  File size: {file_size} bytes")
+        if say:
+            say(f"✓ File '{filename}' read successfully")
+            say(f"  File size: {file_size} bytes")
         
         # Calculate part size
         part_size = (file_size + num_parts - 1) // num_parts
@@ -129,55 +390,84 @@ def read_file_and_split(filename: str, num_parts: int) -> Tuple[bytes, List[byte
             part = original_data[start:end]
             parts.append(part)
         
-        print(f"  Split into {num_parts} parts")
-        print(f"  Part size (target): {part_size} bytes")
+        if say:
+            say(f"  Split into {num_parts} parts")
+            say(f"  Part size (target): {part_size} bytes")
         
         return original_data, parts
         
     except Exception as e:
-        print(f"✗ Error reading file: {e}")
+        if verbose:
+            print(f"✗ Error reading file: {e}")
+        else:
+            logger.error("Error reading file: %s", e)
         return b'', []
 
 def calculate_hash(data: bytes) -> str:
     """Calculate SHA256 hash of data"""
     return hashlib.sha256(data).hexdigest()
 
-def file_based_erasure_coding(filename: str, num_parts: int, k: int, m: int):
-    """Perform erasure coding on file parts with JSON metadata"""
-    print(f"\n{'='*60}")
-    print(f"FILE-BASED ERASURE CODING WITH METADATA")
-    print(f"{'='*60}")
-    print(f"File: {filename}")
-    print(f"Splitting into: {num_parts} parts")
-    print(f"Erasure coding: k={k}, m={m}")
-    
-    # Calculate original file hash
-    with open(filename, 'rb') as f:
-        original_data = f.read()
-    original_hash = calculate_hash(original_data)
-    print(f"Original file SHA256: {original_hash}")
-    print(f"Original file size: {len(original_data)} bytes")
+def calculate_part_hashes(parts: List[bytes]) -> Tuple[str, List[str]]:
+    """SHA256 of the concatenated parts and of each part, in one pass"""
+    if len(parts) == 1:
+        # The only part is the whole file
+        digest = calculate_hash(parts[0])
+        return digest, [digest]
+    whole = hashlib.sha256()
+    part_hashes = []
+    for part in parts:
+        whole.update(part)
+        part_hashes.append(hashlib.sha256(part).hexdigest())
+    return whole.hexdigest(), part_hashes
+
+def file_based_erasure_coding(filename: str, num_parts: int = 1, k: int = 4, m: int = 2, verbose: bool = True) -> bool:
+    """Perform erasure coding on file parts with JSON metadata
+
+    By default the whole file is coded as one (k, m) instance; encode
+    already chunks its input, so splitting into num_parts > 1 only adds
+    k + m fragments and a metadata entry per extra part.
+
+    With verbose=False progress goes to this module's logger at DEBUG
+    level instead of stdout; hash mismatches and errors are still logged
+    at ERROR. Returns True when the reconstructed file matches the original.
+    """
+    say = _reporter(verbose)
+    if say:
+        say(f"\n{'='*60}")
+        say(f"FILE-BASED ERASURE CODING WITH METADATA")
+        say(f"{'='*60}")
+        say(f"File: {filename}")
+        say(f"Splitting into: {num_parts} parts")
+        say(f"Erasure coding: k={k}, m={m} ({_available_scheme(k, m)})")
     
-    # Step 1: Read and split the file
-    _, file_parts = read_file_and_split(filename, num_parts)
+    # Step 1: Read and split the file; the same buffer is hashed below,
+    # so the file is only read once
+    original_data, file_parts = read_file_and_split(filename, num_parts, verbose)
     
     if not file_parts:
-        return
+        return False
+    
+    # Calculate original file hash
+    original_hash, part_hashes = calculate_part_hashes(file_parts)
+    if say:
+        say(f"Original file SHA256: {original_hash}")
+        say(f"Original file size: {len(original_data)} bytes")
     
     # Step 2: Process each file part with erasure coding
     all_fragments = []
     all_metadata = []
     
-    for part_idx, part_data in enumerate(file_parts):
-        print(f"\n--- Encoding Part {part_idx + 1}/{num_parts} ---")
-        print(f"  Part size: {len(part_data)} bytes")
-        
-        ec = SimpleErasureCode(k=k, m=m)
-        fragments, metadata = ec.encode(part_data)
-        
-        print(f"  Created {len(fragments)} fragments ({k} data + {m} parity)")
-        print(f"  Each fragment size: {metadata['chunk_size']} bytes")
-        print(f"  Metadata: original_length={metadata['original_length']}, chunk_size={metadata['chunk_size']}")
+    ec = SimpleErasureCode(k=k, m=m)
+    encoded_parts = ec.encode_many(file_parts, part_hashes)
+    
+    for part_idx, (part_data, (fragments, metadata)) in enumerate(zip(file_parts, encoded_parts)):
+        if say:
+            say(f"\n--- Encoding Part {part_idx + 1}/{num_parts} ---")
+            say(f"  Part size: {len(part_data)} bytes")
+            
+            say(f"  Created {len(fragments)} fragments ({k} data + {m} parity)")
+            say(f"  Each fragment size: {metadata['chunk_size']} bytes")
+            say(f"  Metadata: original_length={metadata['original_length']}, chunk_size={metadata['chunk_size']}")
         
         all_fragments.append(fragments)
         all_metadata.append(metadata)
@@ -195,119 +485,133 @@ def file_based_erasure_coding(filename: str, num_parts: int, k: int, m: int):
     
     with open('reconstruction_metadata.json', 'w') as f:
         json.dump(metadata_file, f, indent=2)
-    print(f"\n✓ Metadata saved to reconstruction_metadata.json")
+    if say:
+        say(f"\n✓ Metadata saved to reconstruction_metadata.json")
     
     # Step 3: Simulate fragment storage and loss
-    print(f"\n{'='*60}")
-    print("SIMULATING FRAGMENT LOSS AND RECONSTRUCTION")
-    print(f"{'='*60}")
+    if say:
+        say(f"\n{'='*60}")
+        say("SIMULATING FRAGMENT LOSS AND RECONSTRUCTION")
+        say(f"{'='*60}")
     
     reconstructed_parts = []
+    # Whole-file hash of the output, fed part by part as each is verified
+    reconstructed_file_hash = hashlib.sha256()
     
     for part_idx, (fragments, metadata) in enumerate(zip(all_fragments, all_metadata)):
-        print(f"\n--- Reconstructing Part {part_idx + 1}/{num_parts} ---")
+        if say:
+            say(f"\n--- Reconstructing Part {part_idx + 1}/{num_parts} ---")
         
         # Simulate random fragment selection (as if some were lost)
-        # Strategy: Ensure we can reconstruct with simple XOR (need k-1 data + 1 parity, or all k data)
-        all_indices = list(range(len(fragments)))
-        random.shuffle(all_indices)
-        
-        # Select k fragments, ensuring we have at least k-1 data fragments
-        # This allows reconstruction with our simple XOR parity
-        selected_indices = []
-        data_count = 0
-        parity_count = 0
-        
-        for idx in all_indices:
-            if len(selected_indices) >= k:
-                break
-            if idx < k:  # Data fragment
-                selected_indices.append(idx)
-                data_count += 1
-            elif data_count >= k - 1:  # Can add parity if we have enough data
-                selected_indices.append(idx)
-                parity_count += 1
-        
-        # If we don't have enough, add more data fragments
-        if len(selected_indices) < k:
-            for idx in range(k):
-                if idx not in selected_indices:
-                    selected_indices.append(idx)
-                if len(selected_indices) >= k:
-                    break
+        if metadata['scheme'] != 'xor':
+            # Reed-Solomon: any k fragments will do
+            selected_indices = random.sample(range(len(fragments)), k)
+        elif m:
+            # XOR: k-1 data fragments plus any parity recovers the missing one
+            selected_indices = random.sample(range(k), k - 1) + [random.choice(range(k, k + m))]
+        else:
+            selected_indices = list(range(k))
         
         selected_indices = sorted(selected_indices)
-        selected_fragments = [fragments[i] for i in selected_indices]
-        
-        data_selected = [i for i in selected_indices if i < k]
-        parity_selected = [i for i in selected_indices if i >= k]
-        
-        print(f"  Available fragments: {selected_indices} (out of {list(range(k+m))})")
-        print(f"    - Data fragments: {data_selected}")
-        print(f"    - Parity fragments: {parity_selected}")
+        if np is not None:
+            selected_fragments = fragments[selected_indices]
+        else:
+            selected_fragments = [fragments[i] for i in selected_indices]
         
-        # Determine what was "lost"
-        lost_indices = sorted(set(range(k+m)) - set(selected_indices))
-        if lost_indices:
-            print(f"  Lost fragments: {lost_indices}")
+        if say:
+            data_selected = [i for i in selected_indices if i < k]
+            parity_selected = [i for i in selected_indices if i >= k]
+            
+            say(f"  Available fragments: {selected_indices} (out of {list(range(k+m))})")
+            say(f"    - Data fragments: {data_selected}")
+            say(f"    - Parity fragments: {parity_selected}")
+            
+            # Determine what was "lost"
+            lost_mask = (1 << (k + m)) - 1
+            for idx in selected_indices:
+                lost_mask ^= 1 << idx
+            lost_indices = [idx for idx in range(k + m) if lost_mask >> idx & 1]
+            if lost_indices:
+                say(f"  Lost fragments: {lost_indices}")
         
         # Reconstruct using metadata
         ec = SimpleErasureCode(k=k, m=m)
         try:
             reconstructed_data = ec.decode(selected_fragments, selected_indices, metadata)
             
-            print(f"  Reconstructed part size: {len(reconstructed_data)} bytes")
-            print(f"  Expected part size: {metadata['original_length']} bytes")
+            if say:
+                say(f"  Reconstructed part size: {len(reconstructed_data)} bytes")
+                say(f"  Expected part size: {metadata['original_length']} bytes")
             
             # Verify this part
             expected_data = file_parts[part_idx]
             reconstructed_hash = calculate_hash(reconstructed_data)
+            reconstructed_file_hash.update(reconstructed_data)
             expected_hash = metadata['data_hash']
             
-            if reconstructed_hash == expected_hash:
-                print(f"  ✓ SUCCESS: Part hash matches! ({reconstructed_hash[:16]}...)")
-            else:
-                print(f"  ✗ FAILED: Hash mismatch!")
-                print(f"    Expected: {expected_hash[:16]}...")
-                print(f"    Got:      {reconstructed_hash[:16]}...")
+            if reconstructed_hash != expected_hash:
+                if verbose:
+                    print(f"  ✗ FAILED: Hash mismatch!")
+                    print(f"    Expected: {expected_hash[:16]}...")
+                    print(f"    Got:      {reconstructed_hash[:16]}...")
+                else:
+                    logger.error("Hash mismatch in part %d: expected %s, got %s",
+                                 part_idx + 1, expected_hash, reconstructed_hash)
+            elif say:
+                say(f"  ✓ SUCCESS: Part hash matches! ({reconstructed_hash[:16]}...)")
             
             reconstructed_parts.append(reconstructed_data)
             
         except Exception as e:
-            print(f"  ✗ ERROR during reconstruction: {e}")
-            return
+            if verbose:
+                print(f"  ✗ ERROR during reconstruction: {e}")
+            else:
+                logger.error("Error reconstructing part %d: %s", part_idx + 1, e)
+            return False
     
     # Step 4: Save and verify reconstructed file
     output_filename = "reconstructed_file.bin"
-    final_reconstructed = b''.join(reconstructed_parts)
     
+    # Parts are written one after another; no joined copy of the file is built
     with open(output_filename, 'wb') as f:
-        f.write(final_reconstructed)
+        f.writelines(reconstructed_parts)
+    reconstructed_size = sum(len(part) for part in reconstructed_parts)
     
-    reconstructed_hash = calculate_hash(final_reconstructed)
+    reconstructed_hash = reconstructed_file_hash.hexdigest()
+    success = original_hash == reconstructed_hash
     
-    print(f"\n{'='*60}")
-    print("FINAL VERIFICATION")
-    print(f"{'='*60}")
+    if say:
+        say(f"\n{'='*60}")
+        say("FINAL VERIFICATION")
+        say(f"{'='*60}")
+        
+        say(f"Original file size: {len(original_data)} bytes")
+        say(f"Reconstructed file size: {reconstructed_size} bytes")
+        say(f"Original file hash: {original_hash}")
+        say(f"Reconstructed file hash: {reconstructed_hash}")
     
-    print(f"Original file size: {len(original_data)} bytes")
-    print(f"Reconstructed file size: {len(final_reconstructed)} bytes")
-    print(f"Original file hash: {original_hash}")
-    print(f"Reconstructed file hash: {reconstructed_hash}")
+    if success:
+        if say:
+            say("\n🎉 SUCCESS: Complete file reconstructed perfectly!")
+            say("✅ HASHES MATCH!")
+            say(f"✅ Output saved to: {output_filename}")
+        return True
     
-    if original_hash == reconstructed_hash:
-        print("\n🎉 SUCCESS: Complete file reconstructed perfectly!")
-        print("✅ HASHES MATCH!")
-        print(f"✅ Output saved to: {output_filename}")
-    else:
+    # Find first difference
+    final_reconstructed = b''.join(reconstructed_parts)
+    first_diff = next((i for i in range(min(len(original_data), len(final_reconstructed)))
+                       if original_data[i] != final_reconstructed[i]), None)
+    if verbose:
         print("\n❌ FAILED: File reconstruction failed!")
-        print(f"   Length match: {len(original_data) == len(final_reconstructed)}")
-        
-        # Find first difference
-        for i in range(min(len(original_data), len(final_reconstructed))):
-            if original_data[i] != final_reconstructed[i]:
-                print(f"   First difference at byte {i}")
-                break
+        print(f"   Length match: {len(original_data) == reconstructed_size}")
+        if first_diff is not None:
+            print(f"   First difference at byte {first_diff}")
+    else:
+        logger.error("Reconstructed file %s does not match the original: hash %s, expected %s "
+                     "(%d of %d bytes, first difference at byte %s)",
+                     output_filename, reconstructed_hash, original_hash,
+                     reconstructed_size, len(original_data), first_diff)
+    return False
 
 def create_test_file():
     """Create a simple test file for verification"""
@@ -323,7 +627,6 @@ if __name__ == "__main__":
     
     file_based_erasure_coding(
         filename=test_filename,
-        num_parts=2,
         k=4,
         m=2
     )
@@ -336,7 +639,6 @@ if __name__ == "__main__":
     if os.path.exists(pdf_filename):
         file_based_erasure_coding(
             filename=pdf_filename,
-            num_parts=3,
             k=4,
             m=2
         )
@@ -350,26 +652,20 @@ Testing with a simple file first...
 FILE-BASED ERASURE CODING WITH METADATA
 ============================================================
 File: test_file.bin
-Splitting into: 2 parts
-Erasure coding: k=4, m=2
-Original file SHA256: cba05664411b3d8c4a7f96c1cfbb31499baebcac0bcc833793006c9e6841c791
-Original file size: 4700 bytes
+Splitting into: 1 parts
+Erasure coding: k=4, m=2 (zfec)
 ✓ File 'test_file.bin' read successfully
   File size: 4700 bytes
-  Split into 2 parts
-  Part size (target): 2350 bytes
-
---- Encoding Part 1/2 ---
-  Part size: 2350 bytes
-  Created 6 fragments (4 data + 2 parity)
-  Each fragment size: 588 bytes
-  Metadata: original_length=2350, chunk_size=588
+  Split into 1 parts
+  Part size (target): 4700 bytes
+Original file SHA256: cba05664411b3d8c4a7f96c1cfbb31499baebcac0bcc833793006c9e6841c791
+Original file size: 4700 bytes
 
---- Encoding Part 2/2 ---
-  Part size: 2350 bytes
+--- Encoding Part 1/1 ---
+  Part size: 4700 bytes
   Created 6 fragments (4 data + 2 parity)
-  Each fragment size: 588 bytes
-  Metadata: original_length=2350, chunk_size=588
+  Each fragment size: 1175 bytes
+  Metadata: original_length=4700, chunk_size=1175
 
 ✓ Metadata saved to reconstruction_metadata.json
 
@@ -377,23 +673,14 @@ Original file size: 4700 bytes
 SIMULATING FRAGMENT LOSS AND RECONSTRUCTION
 ============================================================
 
---- Reconstructing Part 1/2 ---
-  Available fragments: [0, 1, 2, 3] (out of [0, 1, 2, 3, 4, 5])
-    - Data fragments: [0, 1, 2, 3]
-    - Parity fragments: []
-  Lost fragments: [4, 5]
-  Reconstructed part size: 2350 bytes
-  Expected part size: 2350 bytes
-  ✓ SUCCESS: Part hash matches! (dd92c9d0d7c0fd30...)
-
---- Reconstructing Part 2/2 ---
-  Available fragments: [0, 1, 2, 3] (out of [0, 1, 2, 3, 4, 5])
-    - Data fragments: [0, 1, 2, 3]
-    - Parity fragments: []
-  Lost fragments: [4, 5]
-  Reconstructed part size: 2350 bytes
-  Expected part size: 2350 bytes
-  ✓ SUCCESS: Part hash matches! (dd92c9d0d7c0fd30...)
+--- Reconstructing Part 1/1 ---
+  Available fragments: [0, 1, 2, 4] (out of [0, 1, 2, 3, 4, 5])
+    - Data fragments: [0, 1, 2]
+    - Parity fragments: [4]
+  Lost fragments: [3, 5]
+  Reconstructed part size: 4700 bytes
+  Expected part size: 4700 bytes
+  ✓ SUCCESS: Part hash matches! (cba05664411b3d8c...)
 
 ============================================================
 FINAL VERIFICATION
@@ -411,80 +698,5 @@ Reconstructed file hash: cba05664411b3d8c4a7f96c1cfbb31499baebcac0bcc833793006c9
 ============================================================
 NOW TESTING WITH PDF FILE
 ============================================================
-
-============================================================
-FILE-BASED ERASURE CODING WITH METADATA
-============================================================
-File: /content/sample_data/Michael's CV_brief_2025-09-22_1010hr.pdf
-Splitting into: 3 parts
-Erasure coding: k=4, m=2
-Original file SHA256: 60368f509d1d76300a5c5ed1ac1baa7822768c44708d00ac4b41bf13019d0d61
-Original file size: 273105 bytes
-✓ File '/content/sample_data/CV_brief_2025-09-22_1010hr.pdf' read successfully
-  File size: 273105 bytes
-  Split into 3 parts
-  Part size (target): 91035 bytes
-
---- Encoding Part 1/3 ---
-  Part size: 91035 bytes
-  Created 6 fragments (4 data + 2 parity)
-  Each fragment size: 22759 bytes
-  Metadata: original_length=91035, chunk_size=22759
-
---- Encoding Part 2/3 ---
-  Part size: 91035 bytes
-  Created 6 fragments (4 data + 2 parity)
-  Each fragment size: 22759 bytes
-  Metadata: original_length=91035, chunk_size=22759
-
---- Encoding Part 3/3 ---
-  Part size: 91035 bytes
-  Created 6 fragments (4 data + 2 parity)
-  Each fragment size: 22759 bytes
-  Metadata: original_length=91035, chunk_size=22759
-
-✓ Metadata saved to reconstruction_metadata.json
-
-============================================================
-SIMULATING FRAGMENT LOSS AND RECONSTRUCTION
-============================================================
-
---- Reconstructing Part 1/3 ---
-  Available fragments: [0, 1, 2, 3] (out of [0, 1, 2, 3, 4, 5])
-    - Data fragments: [0, 1, 2, 3]
-    - Parity fragments: []
-  Lost fragments: [4, 5]
-  Reconstructed part size: 91035 bytes
-  Expected part size: 91035 bytes
-  ✓ SUCCESS: Part hash matches! (5d84c6bac7577f0b...)
-
---- Reconstructing Part 2/3 ---
-  Available fragments: [0, 1, 2, 3] (out of [0, 1, 2, 3, 4, 5])
-    - Data fragments: [0, 1, 2, 3]
-    - Parity fragments: []
-  Lost fragments: [4, 5]
-  Reconstructed part size: 91035 bytes
-  Expected part size: 91035 bytes
-  ✓ SUCCESS: Part hash matches! (5b10d51fbae8df9b...)
-
---- Reconstructing Part 3/3 ---
-  Available fragments: [0, 1, 2, 3] (out of [0, 1, 2, 3, 4, 5])
-    - Data fragments: [0, 1, 2, 3]
-    - Parity fragments: []
-  Lost fragments: [4, 5]
-  Reconstructed part size: 91035 bytes
-  Expected part size: 91035 bytes
-  ✓ SUCCESS: Part hash matches! (dbe3ec77df7dee25...)
-
-============================================================
-FINAL VERIFICATION
-============================================================
-Original file size: 273105 bytes
-Reconstructed file size: 273105 bytes
-Original file hash: 60368f509d1d76300a5c5ed1ac1baa7822768c44708d00ac4b41bf13019d0d61
-Reconstructed file hash: 60368f509d1d76300a5c5ed1ac1baa7822768c44708d00ac4b41bf13019d0d61
-
-🎉 SUCCESS: Complete file reconstructed perfectly!
-✅ HASHES MATCH!
-✅ Output saved to: reconstructed_file.bin
-"""
\ No newline at end of file
+PDF file not found: /content/sample_data/brief_2025-09-22_1010hr.pdf
+"""
@@ -2,13 +2,22 @@ import random
 import zlib
 from typing import List, Tuple
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 class SimpleErasureCode:
     def __init__(self, k: int, m: int):
         self.k = k  # data fragments
         self.m = m  # parity fragments
     
     def encode(self, data: bytes) -> List[bytes]:
-        """Simple erasure coding simulation"""
+        """Simple erasure coding simulation
+
+        All m parity fragments are the same XOR of the k data chunks, so
+        any m still only recovers a single missing data fragment.
+        """
         chunk_size = (len(data) + self.k - 1) // self.k  # ceiling division
         
         # Split data into k chunks
@@ -22,14 +31,18 @@ class SimpleErasureCode:
                 chunk += b'\x00' * (chunk_size - len(chunk))
             chunks.append(chunk)
         
-        # Create parity chunks (simplified - using XOR)
-        parity_chunks = []
-        for i in range(self.m):
-            parity = bytearray(chunk_size)
-            for j in range(self.k):
-                for idx in range(chunk_size):
-                    parity[idx] ^= chunks[j][idx]
-            parity_chunks.append(bytes(parity))
+        # Create parity chunks (simplified - using XOR). Every parity chunk is
+        # the same XOR of all k chunks, so it is computed once and shared.
+        if np is not None:
+            arr = np.frombuffer(b''.join(chunks), dtype=np.uint8).reshape(self.k, chunk_size)
+            parity = np.bitwise_xor.reduce(arr, axis=0).tobytes()
+        else:
+            # Without NumPy, XOR whole chunks as big ints (word-at-a-time in C)
+            parity_int = 0
+            for chunk_data in chunks:
+                parity_int ^= int.from_bytes(chunk_data, 'little')
+            parity = parity_int.to_bytes(chunk_size, 'little')
+        parity_chunks = [parity] * self.m
         
         return chunks + parity_chunks
     